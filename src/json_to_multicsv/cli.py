@@ -1,12 +1,15 @@
 """Command-line interface for json-to-multicsv."""
 
-import csv
 import re
 
 import click
 
-from .converter import ConvertError, json_to_multicsv
+from .converter import ConvertError, convert_to_sink, require_ijson
 from .parser import PathSpecError, build_handlers
+from .sink import CsvSink, SinkError
+
+# A table path spec split around its table name, for --no-prefix hints.
+_TABLE_SPEC_RE = re.compile(r"^(?P<prefix>.+:table:)(?P<name>[^:]+)(?P<suffix>:.+)?$")
 
 
 def _parse_paths(ctx, param, value):
@@ -23,8 +26,8 @@ def _check_no_prefix_collisions(handlers, table_name, raw_paths):
     """Check for duplicate leaf table names when --no-prefix is used."""
     seen = {}  # name -> source description
 
-    # Check if a root row handler exists (components == [])
-    has_root_row = any(h.kind == "row" and h.components == [] for h in handlers)
+    # Check if a root row handler exists (components == ())
+    has_root_row = any(h.kind == "row" and h.components == () for h in handlers)
     if has_root_row:
         if not table_name:
             raise click.ClickException(
@@ -37,12 +40,9 @@ def _check_no_prefix_collisions(handlers, table_name, raw_paths):
             name = handler.name
             if name in seen:
                 suggestion = f"  --path '...:table:{name}_2'"
-                pattern = re.compile(
-                    r"^(?P<prefix>.+:table:)" + re.escape(name) + r"(?P<suffix>:.+)?$"
-                )
                 for path_spec in reversed(raw_paths):
-                    m = pattern.match(path_spec)
-                    if m:
+                    m = _TABLE_SPEC_RE.match(path_spec)
+                    if m and m.group("name") == name:
                         suffix = m.group("suffix") or ""
                         suggestion = f"  --path '{m.group('prefix')}{name}_2{suffix}'"
                         break
@@ -61,7 +61,7 @@ def _check_no_prefix_collisions(handlers, table_name, raw_paths):
     "--file",
     "input_file",
     default="-",
-    type=click.File(encoding="utf-8"),
+    type=click.File("rb"),
     help="JSON input file (default: stdin)",
 )
 @click.option(
@@ -79,22 +79,35 @@ def _check_no_prefix_collisions(handlers, table_name, raw_paths):
     default=False,
     help="Use only the last component of the table name for output filenames.",
 )
-def main(ctx, input_file, handlers, table_name, no_prefix):
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Parse the input incrementally instead of loading it into memory.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    metavar="N",
+    help="Worker processes for a top-level array table (default: 1).",
+)
+def main(ctx, input_file, handlers, table_name, no_prefix, stream, jobs):
     """Split a JSON file with hierarchical data to multiple CSV files."""
     if no_prefix:
         _check_no_prefix_collisions(handlers, table_name, ctx.obj["raw_paths"])
+    if stream:
+        try:
+            require_ijson()
+        except ImportError as e:
+            raise click.UsageError(f"--stream: {e}") from None
 
     try:
-        tables = json_to_multicsv(input_file, handlers, table_name)
+        with CsvSink(no_prefix=no_prefix) as sink:
+            convert_to_sink(
+                input_file, handlers, sink, table_name, stream=stream, jobs=jobs
+            )
     except ConvertError as e:
         raise click.BadParameter(str(e), param_hint="'--path'") from None
-
-    for table_parts, rows in tables.items():
-        # Unique column names in insertion order (keys first, then data).
-        fields = list(dict.fromkeys(k for row in rows for k in row))
-        prefix = table_parts[-1] if no_prefix else ".".join(table_parts)
-        filename = f"{prefix}.csv"
-        with open(filename, "w") as f:
-            writer = csv.DictWriter(f, fieldnames=fields, restval="")
-            writer.writeheader()
-            writer.writerows(rows)
+    except SinkError as e:
+        raise click.ClickException(str(e)) from None
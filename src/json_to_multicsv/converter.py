@@ -1,57 +1,286 @@
 """Core conversion logic for json-to-multicsv.
 
-JSON objects are decoded with a custom object_pairs_hook that sorts
-keys at decode time.  The Converter then walks the decoded tree
-top-down, applying path-based handlers to build the output tables.
+The input is decoded with orjson when it is installed, falling back to
+the standard library json module.  The Converter then walks the decoded
+tree top-down in sorted key order, applying path-based handlers to build
+the output tables.
+
+StreamingConverter produces the same tables from an ijson event stream
+without decoding the whole document first.  It visits object members
+in document order.
 """
 
+import dataclasses
 import json
-from collections import defaultdict
+import multiprocessing
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from decimal import Decimal
+
+from json_to_multicsv.parser import (
+    KIND_COLUMN,
+    KIND_IGNORE,
+    KIND_ROW,
+    KIND_TABLE,
+    Handler,
+)
+from json_to_multicsv.sink import InMemorySink
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore[assignment]
 
-from json_to_multicsv.parser import Handler
+
+# Array indices as strings.  Most arrays are short, so their keys are
+# shared objects (with cached hashes) rather than a fresh str per element.
+_INDEX_STRS = tuple(sys.intern(str(i)) for i in range(1024))
 
 
 class ConvertError(Exception):
     """Raised when the converter encounters data it cannot handle."""
 
 
-def _sorted_dict(items: list[tuple[str, object]]) -> dict:
-    return dict(sorted(items))
+def require_ijson() -> None:
+    """Raise ImportError unless ijson, needed for streaming, is installed."""
+    if ijson is None:
+        raise ImportError(
+            "streaming requires ijson: pip install 'json-to-multicsv[stream]'"
+        )
+
+
+def _load(fileobj):
+    """Decode a JSON document from a file object.
+
+    orjson rejects a few inputs the standard library accepts (NaN,
+    Infinity, integers wider than 64 bits), so on a decode error we
+    retry with json.loads to keep the accepted input unchanged.
+    """
+    raw = fileobj.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+@dataclass(eq=False, slots=True)
+class _TrieNode:
+    """A node in the handler trie, one level per path component."""
+
+    children: dict[str, "_TrieNode"]
+    # (position in the handler list, handler) for specs ending here.
+    handlers: list[tuple[int, Handler]]
+
+
+def _build_trie(handlers: list[Handler]) -> _TrieNode:
+    root = _TrieNode({}, [])
+    for index, handler in enumerate(handlers):
+        node = root
+        for component in handler.components:
+            node = node.children.setdefault(component, _TrieNode({}, []))
+        node.handlers.append((index, handler))
+    return root
+
+
+def _pick_handler(nodes: tuple[_TrieNode, ...]) -> Handler | None:
+    """Choose among the handlers of every spec matching a path.
+
+    The first non-fallback handler in list order wins, otherwise the
+    last fallback, as with a linear scan over the handler list.
+    """
+    best: tuple[int, Handler] | None = None
+    fallback: tuple[int, Handler] | None = None
+    for node in nodes:
+        for index, handler in node.handlers:
+            if handler.fallback:
+                if fallback is None or index > fallback[0]:
+                    fallback = (index, handler)
+            elif best is None or index < best[0]:
+                best = (index, handler)
+    if best is not None:
+        return best[1]
+    return fallback[1] if fallback is not None else None
+
+
+class _TrieState:
+    """The trie nodes matched by a path so far, and the path's handler.
+
+    States are built lazily as paths are walked; moving to a child path
+    is a dict lookup on the parent's state, so the walkers never look up
+    a handler by the full path.
+    """
+
+    __slots__ = (
+        "nodes",
+        "handler",
+        "ignore",
+        "labels",
+        "transitions",
+        "other",
+        "child_tables",
+        "column_names",
+    )
+
+    def __init__(self, nodes: tuple[_TrieNode, ...]) -> None:
+        self.nodes = nodes
+        self.handler = _pick_handler(nodes)
+        # Paths under an ignore handler are skipped without being visited.
+        self.ignore = self.handler is not None and self.handler.kind_id == KIND_IGNORE
+        # Concrete components some node has an edge for; every other
+        # component can only follow '*' edges and shares one successor.
+        self.labels = frozenset(c for n in nodes for c in n.children if c != "*")
+        self.transitions: dict[str, _TrieState] = {}
+        self.other: _TrieState | None = None
+        # For table handlers: enclosing table parts -> (table parts, key
+        # column) of the tables this state opens, filled in by the walkers.
+        self.child_tables: dict[tuple[str, ...], tuple[tuple[str, ...], str]] = {}
+        # For column handlers: field prefix -> that prefix's column names.
+        self.column_names: dict[str | None, dict[str, str]] = {}
+
+    def step(self, component: str) -> "_TrieState":
+        state = self.transitions.get(component)
+        if state is not None:
+            return state
+        if component not in self.labels:
+            if self.other is None:
+                self.other = self._successor("*")
+            return self.other
+        state = self.transitions[component] = self._successor(component)
+        return state
+
+    def _successor(self, component: str) -> "_TrieState":
+        nodes = []
+        for node in self.nodes:
+            child = node.children.get(component)
+            if child is not None:
+                nodes.append(child)
+            if component != "*":
+                child = node.children.get("*")
+                if child is not None:
+                    nodes.append(child)
+        return _TrieState(tuple(nodes))
+
+
+@dataclass(slots=True)
+class _Frame:
+    """An open object or array in the walk, with how to treat its children."""
+
+    handler: Handler
+    state: _TrieState
+    # Length of the shared path list up to and including this container.
+    depth: int
+    ancestor_keys: tuple[tuple[str, str], ...]
+    table_parts: tuple[str, ...]
+    # The sink's id for table_parts, so rows are added without hashing it.
+    table_id: int
+    field: str | None
+    row: dict | None
+    is_array: bool
+    col_name: str = ""
+    index: int = 0
+    # Remaining (key, value) pairs when walking a decoded tree.
+    children: Iterator[tuple[str, object]] = iter(())
+    # Row opened by the enclosing table for this container, handed to
+    # the sink (with its table id) when the container closes.
+    owned_row: tuple[int, dict] | None = None
+    # The frame whose row ``row`` is, unless that is this frame's own
+    # owned_row.
+    row_owner: "_Frame | None" = None
+    # For rows nested in an open row of the same table: the frame owning
+    # that row, which emits this one after its own so that rows keep
+    # the order in which they were opened.
+    holder: "_Frame | None" = None
+    held: list[dict] | None = None
+    # For tables: the ancestor key columns every child row starts with.
+    proto: dict = dataclasses.field(default_factory=dict)
+    # For columns: child key -> flattened column name, shared by every
+    # container with the same state and field.
+    names: dict[str, str] = dataclasses.field(default_factory=dict)
 
 
 class Converter:
-    """Walks a decoded JSON tree top-down, collecting rows into tables."""
+    """Walks a decoded JSON tree top-down, passing finished rows to a sink.
+
+    The sink maps table parts to an id with ``table_id(table_parts)`` and
+    receives rows with ``append(table_id, row)``; each row is handed over
+    once all of its columns have been filled in.
+    """
 
     def __init__(
         self,
         handlers: list[Handler],
         table_name: str | None = None,
+        sink=None,
+        jobs: int = 1,
     ):
         self.handlers = handlers
-        self.tables: defaultdict[tuple[str, ...], list[dict]] = defaultdict(list)
-        self._initial_table_parts = (table_name,) if table_name else ()
-
-    def convert(self, fileobj) -> dict[tuple[str, ...], list[dict]]:
-        data = json.load(fileobj, object_pairs_hook=_sorted_dict)
-        self._walk(
-            data,
-            path=(),
-            ancestor_keys=(),
-            table_parts=self._initial_table_parts,
-            field=None,
-            row=None,
+        self.table_name = table_name
+        self.sink = sink if sink is not None else InMemorySink()
+        self.jobs = jobs
+        self._initial_table_parts: tuple[str, ...] = (table_name,) if table_name else ()
+        self._root_state = _TrieState((_build_trie(handlers),))
+
+    def convert(self, fileobj) -> dict[tuple[str, ...], list[dict]] | None:
+        """Convert a JSON file, passing its rows to the sink.
+
+        With an InMemorySink, the default, the collected tables are
+        returned as well; with any other sink this returns None.
+        """
+        data = _load(fileobj)
+        root_handler = self._root_state.handler
+        if (
+            self.jobs > 1
+            and type(data) is list
+            and root_handler is not None
+            and root_handler.kind_id == KIND_TABLE
+        ):
+            self._walk_parallel(data)
+        else:
+            self._walk(data)
+        return self._tables()
+
+    def _tables(self) -> dict[tuple[str, ...], list[dict]] | None:
+        if isinstance(self.sink, InMemorySink):
+            return self.sink.tables
+        return None
+
+    def _walk_parallel(self, data: list) -> None:
+        """Walk slices of a top-level table array in worker processes.
+
+        Every element of the array is an independent row of the root
+        table.  Workers return their tables per slice, and the slices are
+        replayed into the sink in input order, so the output is the same
+        as walking the array in this process.
+        """
+        chunk_size = max(1, len(data) // (self.jobs * 4))
+        chunks = (
+            (start, data[start : start + chunk_size])
+            for start in range(0, len(data), chunk_size)
         )
-        return self.tables
+        with multiprocessing.Pool(
+            self.jobs,
+            initializer=_init_worker,
+            initargs=(self.handlers, self.table_name),
+        ) as pool:
+            for tables in pool.imap(_walk_chunk, chunks):
+                for table_parts, rows in tables.items():
+                    table_id = self.sink.table_id(table_parts)
+                    for row in rows:
+                        self.sink.append(table_id, row)
 
     def _find_handler(self, path: tuple[str, ...]) -> Handler | None:
-        fallback = None
-        for handler in self.handlers:
-            if handler.matches(path):
-                if handler.fallback:
-                    fallback = handler
-                else:
-                    return handler
-        return fallback
+        state = self._root_state
+        for component in path:
+            state = state.step(component)
+        return state.handler
 
     def _path_to_pathspec(self, path: tuple[str, ...]) -> str:
         """Build a pathspec suggestion from a concrete path.
@@ -79,90 +308,448 @@ class Converter:
             f"  --path '{spec_path}:ignore'"
         )
 
-    def _walk(self, val, *, path, ancestor_keys, table_parts, field, row):
-        handler = self._find_handler(path)
+    def _key_column(
+        self,
+        handler: Handler,
+        child_parts: tuple[str, ...],
+        ancestor_keys: tuple[tuple[str, str], ...],
+    ) -> str:
+        if handler.key_name:
+            return handler.key_name
+        return sys.intern(".".join(child_parts[: len(ancestor_keys) + 1]) + "._key")
 
-        if handler and handler.kind == "ignore":
-            return
+    def _child_table(
+        self,
+        state: _TrieState,
+        table_parts: tuple[str, ...],
+        ancestor_keys: tuple[tuple[str, str], ...],
+    ) -> tuple[tuple[str, ...], str]:
+        """Work out, and remember, the table a table state opens.
 
-        # Scalars go directly into the current row.
-        if not isinstance(val, dict | list):
-            if field in row:
-                json_path = "/" + "/".join(path)
-                raise ConvertError(
-                    f"Column name {field!r} already exists in table "
-                    f"{'.'.join(table_parts)!r} at {json_path}\n"
-                    f"This can happen when a JSON key contains '.' and "
-                    f"collides with a flattened nested path."
-                )
-            row[field] = val
+        The nesting depth follows from the enclosing table parts, so the
+        result is the same for every container at this state under them.
+        """
+        handler = state.handler
+        assert handler is not None
+        assert handler.name is not None
+        child_parts = table_parts + (handler.name,)
+        entry = (child_parts, self._key_column(handler, child_parts, ancestor_keys))
+        state.child_tables[table_parts] = entry
+        return entry
+
+    def _column_name(self, parent: _Frame, child_key: str) -> str:
+        pf = parent.field
+        name = sys.intern(f"{pf}.{child_key}" if pf is not None else child_key)
+        parent.names[child_key] = name
+        return name
+
+    def _set_field(self, row, field, val, path, table_parts) -> None:
+        """Store a scalar in the current row, refusing to overwrite a column."""
+        if field in row:
+            json_path = "/" + "/".join(path)
+            raise ConvertError(
+                f"Column name {field!r} already exists in table "
+                f"{'.'.join(table_parts)!r} at {json_path}\n"
+                f"This can happen when a JSON key contains '.' and "
+                f"collides with a flattened nested path."
+            )
+        row[field] = val
+
+    def _open_frame(
+        self,
+        handler: Handler,
+        state: _TrieState,
+        path: list[str],
+        ancestor_keys: tuple[tuple[str, str], ...],
+        table_parts: tuple[str, ...],
+        table_id: int,
+        field: str | None,
+        row: dict | None,
+        owned_row: tuple[int, dict] | None,
+        row_owner: _Frame | None,
+        is_array: bool,
+    ) -> _Frame:
+        """Open a frame for a container, set up for its handler's kind."""
+        frame = _Frame(
+            handler,
+            state,
+            len(path),
+            ancestor_keys,
+            table_parts,
+            table_id,
+            field,
+            row,
+            is_array,
+        )
+        frame.owned_row = owned_row
+        frame.row_owner = row_owner
+        kind = handler.kind_id
+        if kind == KIND_TABLE:
+            entry = state.child_tables.get(table_parts)
+            if entry is None:
+                entry = self._child_table(state, table_parts, ancestor_keys)
+            frame.table_parts, frame.col_name = entry
+            frame.table_id = self.sink.table_id(frame.table_parts)
+            frame.proto = dict(ancestor_keys)
+        elif kind == KIND_COLUMN:
+            if handler.fallback and is_array:
+                raise self._no_handler_error(tuple(path), "array")
+            frame.names = state.column_names.setdefault(field, {})
+        elif kind == KIND_ROW:
+            if owned_row is None:
+                frame.holder = row_owner
+            frame.row = dict(ancestor_keys)
+        return frame
+
+    def _walk(self, data, first_index: int = 0) -> None:
+        """Walk a decoded tree depth-first with an explicit stack.
+
+        Each stack entry is an open object or array with an iterator over
+        its remaining children, so memory use grows with nesting depth
+        and deep documents do not hit the recursion limit.  When the root
+        is a slice of a larger array, ``first_index`` is the index of its
+        first element.
+        """
+        sink = self.sink
+        # Bound once, since every row is emitted from the loop below.
+        append = sink.append
+        stack: list[_Frame] = []
+        # Path of the value being visited, shared by all frames: a frame's
+        # own path is the first ``depth`` components.
+        path: list[str] = []
+
+        # The value to visit next and the context it is visited in.
+        val = data
+        state = self._root_state
+        ancestor_keys: tuple[tuple[str, str], ...] = ()
+        table_parts = self._initial_table_parts
+        table_id = sink.table_id(table_parts)
+        field: str | None = None
+        row: dict | None = None
+        row_owner: _Frame | None = None
+        owned_row: tuple[int, dict] | None = None
+        # Ignored children are skipped when the walk advances to them,
+        # so only the root needs checking here.
+        if state.ignore:
             return
 
-        if not handler:
-            val_type = "object" if isinstance(val, dict) else "array"
-            raise self._no_handler_error(path, val_type)
+        while True:
+            handler = state.handler
+            # The decoders only produce plain dicts and lists, so exact
+            # type checks are enough and cheaper than isinstance.
+            val_type = type(val)
 
-        # Normalize objects and lists into (key, value) pairs.
-        if isinstance(val, dict):
-            children = val.items()
-        else:
-            children = ((str(i), v) for i, v in enumerate(val))
-
-        match handler.kind:
-            case "table":
-                tbl_name = handler.name
-                child_parts = table_parts + (tbl_name,)
-                if handler.key_name:
-                    col_name = handler.key_name
-                else:
-                    col_name = ".".join(child_parts[: len(ancestor_keys) + 1]) + "._key"
-                for child_key, child in children:
-                    child_ancestor_keys = ancestor_keys + ((col_name, child_key),)
-                    child_row = dict(child_ancestor_keys)
-                    self.tables[child_parts].append(child_row)
-                    if not isinstance(child, dict | list):
-                        child_row[tbl_name] = child
+            # Scalars go directly into the current row.
+            if val_type is not dict and val_type is not list:
+                self._set_field(row, field, val, path, table_parts)
+
+            else:
+                is_array = val_type is list
+                if not handler:
+                    raise self._no_handler_error(
+                        tuple(path), "array" if is_array else "object"
+                    )
+
+                frame = self._open_frame(
+                    handler,
+                    state,
+                    path,
+                    ancestor_keys,
+                    table_parts,
+                    table_id,
+                    field,
+                    row,
+                    owned_row,
+                    row_owner,
+                    is_array,
+                )
+                # Object members are visited in sorted key order so
+                # output is stable.  Every handler kind uses array indices
+                # as strings (key column values or field names), so they
+                # are converted up front, in C via map and zip.
+                if is_array:
+                    start = 0 if stack else first_index
+                    end = start + len(val)
+                    if end <= len(_INDEX_STRS):
+                        keys: Iterable[str] = _INDEX_STRS[start:end]
                     else:
-                        self._walk(
-                            child,
-                            path=path + (child_key,),
-                            ancestor_keys=child_ancestor_keys,
-                            table_parts=child_parts,
-                            field=None,
-                            row=child_row,
-                        )
-
-            case "column":
-                if handler.fallback and isinstance(val, list):
-                    raise self._no_handler_error(path, "array")
-                for child_key, child in children:
-                    self._walk(
-                        child,
-                        path=path + (child_key,),
-                        ancestor_keys=ancestor_keys,
-                        table_parts=table_parts,
-                        field=(
-                            f"{field}.{child_key}" if field is not None else child_key
-                        ),
-                        row=row,
+                        keys = map(str, range(start, end))
+                    frame.children = zip(keys, val)
+                else:
+                    frame.children = iter(sorted(val.items()))
+                stack.append(frame)
+
+            # Advance to the next child of the innermost open container,
+            # closing containers whose children are exhausted.
+            while stack:
+                parent = stack[-1]
+                item = next(parent.children, None)
+                if item is None:
+                    stack.pop()
+                    _close(parent, append)
+                    continue
+
+                child_key, val = item
+                table_parts = parent.table_parts
+                table_id = parent.table_id
+                owned_row = None
+
+                kind = parent.handler.kind_id
+                if kind == KIND_TABLE:
+                    # Copying the prototype is a C-level clone, unlike
+                    # rebuilding the row from the ancestor key pairs.
+                    row = parent.proto.copy()
+                    row[parent.col_name] = child_key
+                    val_type = type(val)
+                    if val_type is not dict and val_type is not list:
+                        row[table_parts[-1]] = val
+                        append(table_id, row)
+                        continue
+                    ancestor_keys = parent.ancestor_keys + (
+                        (parent.col_name, child_key),
+                    )
+                    owned_row = (table_id, row)
+                    row_owner = None
+                    field = None
+                elif kind == KIND_COLUMN:
+                    ancestor_keys = parent.ancestor_keys
+                    row = parent.row
+                    row_owner = (
+                        parent if parent.owned_row is not None else parent.row_owner
+                    )
+                    # Each flattened name is built once and then reused,
+                    # so every row shares one key object per column.
+                    field = parent.names.get(child_key)
+                    if field is None:
+                        field = self._column_name(parent, child_key)
+                elif kind == KIND_ROW:
+                    ancestor_keys = parent.ancestor_keys
+                    row = parent.row
+                    row_owner = parent
+                    field = sys.intern(child_key)
+                state = parent.state.step(child_key)
+                if state.ignore:
+                    if owned_row is not None:
+                        append(*owned_row)
+                    continue
+                del path[parent.depth :]
+                path.append(child_key)
+                break
+            else:
+                return
+
+
+class StreamingConverter(Converter):
+    """Builds the same tables as Converter from an ijson event stream.
+
+    Only the chain of currently open containers is held in memory, not
+    the decoded document.  Object members are visited in document order
+    rather than sorted order, so row and column order follow the input.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        require_ijson()
+        super().__init__(*args, **kwargs)
+
+    def convert(self, fileobj) -> dict[tuple[str, ...], list[dict]] | None:
+        sink = self.sink
+        append = sink.append
+        stack: list[_Frame] = []
+        path: list[str] = []
+        key = ""
+        skip_depth = 0
+
+        # ijson yields non-integral numbers as Decimal.  They are stored
+        # as floats, like json.loads, while integers keep their full width.
+        for _, event, value in ijson.parse(fileobj):
+            # Inside an ignored subtree only the nesting depth matters.
+            if skip_depth:
+                if event == "start_map" or event == "start_array":
+                    skip_depth += 1
+                elif event == "end_map" or event == "end_array":
+                    skip_depth -= 1
+                continue
+
+            if event == "map_key":
+                key = value
+                continue
+            if event == "end_map" or event == "end_array":
+                _close(stack.pop(), append)
+                continue
+
+            is_container = event == "start_map" or event == "start_array"
+            owned_row = None
+
+            if not stack:
+                state = self._root_state
+                ancestor_keys: tuple[tuple[str, str], ...] = ()
+                table_parts = self._initial_table_parts
+                table_id = sink.table_id(table_parts)
+                field = None
+                row = None
+                row_owner = None
+            else:
+                parent = stack[-1]
+                if parent.is_array:
+                    index = parent.index
+                    child_key = (
+                        _INDEX_STRS[index] if index < len(_INDEX_STRS) else str(index)
                     )
+                    parent.index += 1
+                else:
+                    child_key = key
+                del path[parent.depth :]
+                path.append(child_key)
+                table_parts = parent.table_parts
+                table_id = parent.table_id
 
-            case "row":
-                new_row = dict(ancestor_keys)
-                self.tables[table_parts].append(new_row)
-                for child_key, child in children:
-                    self._walk(
-                        child,
-                        path=path + (child_key,),
-                        ancestor_keys=ancestor_keys,
-                        table_parts=table_parts,
-                        field=child_key,
-                        row=new_row,
+                kind = parent.handler.kind_id
+                if kind == KIND_TABLE:
+                    row = parent.proto.copy()
+                    row[parent.col_name] = child_key
+                    if not is_container:
+                        if type(value) is Decimal:
+                            value = float(value)
+                        row[table_parts[-1]] = value
+                        append(table_id, row)
+                        continue
+                    ancestor_keys = parent.ancestor_keys + (
+                        (parent.col_name, child_key),
                     )
+                    owned_row = (table_id, row)
+                    row_owner = None
+                    field = None
+                elif kind == KIND_COLUMN:
+                    ancestor_keys = parent.ancestor_keys
+                    row = parent.row
+                    row_owner = (
+                        parent if parent.owned_row is not None else parent.row_owner
+                    )
+                    field = parent.names.get(child_key)
+                    if field is None:
+                        field = self._column_name(parent, child_key)
+                elif kind == KIND_ROW:
+                    ancestor_keys = parent.ancestor_keys
+                    row = parent.row
+                    row_owner = parent
+                    field = sys.intern(child_key)
+                state = parent.state.step(child_key)
+
+            handler = state.handler
+
+            if state.ignore:
+                if is_container:
+                    skip_depth = 1
+                    if owned_row is not None:
+                        append(*owned_row)
+                continue
+
+            if not is_container:
+                if type(value) is Decimal:
+                    value = float(value)
+                self._set_field(row, field, value, path, table_parts)
+                continue
+
+            is_array = event == "start_array"
+            if not handler:
+                raise self._no_handler_error(
+                    tuple(path), "array" if is_array else "object"
+                )
+
+            stack.append(
+                self._open_frame(
+                    handler,
+                    state,
+                    path,
+                    ancestor_keys,
+                    table_parts,
+                    table_id,
+                    field,
+                    row,
+                    owned_row,
+                    row_owner,
+                    is_array,
+                )
+            )
+
+        return self._tables()
+
+
+def _close(frame: _Frame, append) -> None:
+    """Hand the rows a closing container owns to the sink.
+
+    Rows are emitted in the order they were opened: a row held back by
+    this frame follows its own row, and a row nested in an open row of
+    the same table is held by that row's frame instead.
+    """
+    owned_row = frame.owned_row
+    if frame.handler.kind_id == KIND_ROW and frame.row is not None:
+        holder = frame.holder
+        if holder is not None:
+            if holder.held is None:
+                holder.held = []
+            holder.held.append(frame.row)
+            if frame.held:
+                holder.held.extend(frame.held)
+            return
+        if owned_row is not None:
+            append(*owned_row)
+        append(frame.table_id, frame.row)
+    elif owned_row is not None:
+        append(*owned_row)
+    if frame.held:
+        table_id = owned_row[0] if owned_row is not None else frame.table_id
+        for row in frame.held:
+            append(table_id, row)
+
+
+_worker_converter: Converter | None = None
+
+
+def _init_worker(handlers: list[Handler], table_name: str | None) -> None:
+    global _worker_converter
+    _worker_converter = Converter(handlers, table_name)
+
+
+def _walk_chunk(
+    chunk: tuple[int, list],
+) -> dict[tuple[str, ...], list[dict]]:
+    """Worker entry point: convert one slice of the top-level array."""
+    start, items = chunk
+    assert _worker_converter is not None
+    sink = _worker_converter.sink = InMemorySink()
+    _worker_converter._walk(items, first_index=start)
+    return sink.tables
+
+
+def convert_to_sink(
+    fileobj,
+    handlers: list[Handler],
+    sink,
+    table_name: str | None = None,
+    stream: bool = False,
+    jobs: int = 1,
+) -> None:
+    """Parse a JSON file and pass each finished row to ``sink.append``.
+
+    With ``stream=True`` the input is parsed incrementally with ijson.
+    With ``jobs > 1`` a top-level array handled as a table is split
+    across that many worker processes; other inputs are walked here.
+    """
+    if stream:
+        StreamingConverter(handlers, table_name, sink).convert(fileobj)
+    else:
+        Converter(handlers, table_name, sink, jobs).convert(fileobj)
 
 
 def json_to_multicsv(
-    fileobj, handlers: list[Handler], table_name: str | None = None
+    fileobj,
+    handlers: list[Handler],
+    table_name: str | None = None,
+    stream: bool = False,
+    jobs: int = 1,
 ) -> dict[tuple[str, ...], list[dict]]:
     """Parse a JSON file and convert into a dict of named row lists."""
-    return Converter(handlers, table_name).convert(fileobj)
+    sink = InMemorySink()
+    convert_to_sink(fileobj, handlers, sink, table_name, stream, jobs)
+    return sink.tables
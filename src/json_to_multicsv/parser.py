@@ -2,28 +2,67 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, field
 
 
 class PathSpecError(ValueError):
     """Raised when a path spec is malformed."""
 
 
-_VALID_KINDS = {"table", "column", "row", "ignore"}
+_VALID_KINDS = frozenset({"table", "column", "row", "ignore"})
+_VALID_KINDS_TEXT = ", ".join(sorted(_VALID_KINDS))
 
+# The whole grammar of a valid spec.  Specs that match are parsed with
+# one C-level match; anything else goes through the lexer, which finds
+# and points at the error.
+_SPEC_RE = re.compile(
+    r"/(?P<path>[^/:]+(?:/[^/:]+)*)?:"
+    r"(?:table:(?P<name>[^/:]+)(?::(?P<key_name>[^/:]+))?"
+    r"|(?P<kind>column|row|ignore))"
+)
 
-@dataclass
+# Integer codes for Handler.kind, which the converter compares per node.
+KIND_TABLE = 0
+KIND_COLUMN = 1
+KIND_ROW = 2
+KIND_IGNORE = 3
+
+_KIND_IDS = {
+    "table": KIND_TABLE,
+    "column": KIND_COLUMN,
+    "row": KIND_ROW,
+    "ignore": KIND_IGNORE,
+}
+
+
+@dataclass(slots=True)
 class Handler:
     kind: str
-    components: list[str]
+    components: tuple[str, ...]
     name: str | None = None
     key_name: str | None = None
     fallback: bool = False
+    kind_id: int = field(init=False, repr=False, compare=False)
+    # (index, component) for every non-wildcard component.
+    _literals: tuple[tuple[int, str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.kind_id = _KIND_IDS[self.kind]
+        self._literals = tuple(
+            (i, c) for i, c in enumerate(self.components) if c != "*"
+        )
 
     def matches(self, path: tuple[str, ...]) -> bool:
         if len(path) != len(self.components):
             return False
-        return all(c == "*" or c == p for c, p in zip(self.components, path))
+        for i, c in self._literals:
+            if path[i] != c:
+                return False
+        return True
 
 
 class _Lexer:
@@ -66,6 +105,20 @@ class _Lexer:
 
 def parse_path_spec(spec: str) -> Handler:
     """Parse a --path value like '/:table:item' into a Handler."""
+    m = _SPEC_RE.fullmatch(spec)
+    if m is None:
+        return _parse_with_lexer(spec)
+    path, name, key_name, kind = m.group("path", "name", "key_name", "kind")
+    return Handler(
+        kind=kind or "table",
+        components=tuple(map(sys.intern, path.split("/"))) if path else (),
+        name=name,
+        key_name=key_name,
+    )
+
+
+def _parse_with_lexer(spec: str) -> Handler:
+    """Parse a spec character by character, raising a pointed error."""
     lex = _Lexer(spec)
 
     # -- path: expect leading '/' --
@@ -90,8 +143,7 @@ def parse_path_spec(spec: str) -> Handler:
         # Back up to point at the start of the bad kind
         lex._pos -= len(kind)
         raise lex.error(
-            f"Unknown handler kind {kind!r}, "
-            f"expected one of: {', '.join(sorted(_VALID_KINDS))}"
+            f"Unknown handler kind {kind!r}, expected one of: {_VALID_KINDS_TEXT}"
         )
 
     # -- name (only for table) --
@@ -110,7 +162,12 @@ def parse_path_spec(spec: str) -> Handler:
     if not lex.at_end():
         raise lex.error("Unexpected content")
 
-    return Handler(kind=kind, components=components, name=name, key_name=key_name)
+    return Handler(
+        kind=kind,
+        components=tuple(map(sys.intern, components)),
+        name=name,
+        key_name=key_name,
+    )
 
 
 def build_handlers(path_specs: list[str]) -> list[Handler]:
@@ -122,7 +179,7 @@ def build_handlers(path_specs: list[str]) -> list[Handler]:
         handlers.append(
             Handler(
                 kind="column",
-                components=h.components + ["*"],
+                components=h.components + ("*",),
                 fallback=True,
             )
         )
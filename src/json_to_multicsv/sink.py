@@ -0,0 +1,210 @@
+"""Destinations for the rows produced by the converter.
+
+The converter hands each row to a sink once the row is complete.
+InMemorySink collects rows into lists; CsvSink writes each table to its
+own CSV file without holding the rows in memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import shutil
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+# Output files are written in one pass, so a large buffer saves syscalls.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+class SinkError(Exception):
+    """Raised when rows cannot be written where the sink would put them."""
+
+
+class InMemorySink:
+    """Collects rows into lists keyed by table name parts.
+
+    The converter asks for a table's id once, when it opens the table,
+    then appends rows by id, so adding a row is a list index rather than
+    a tuple hash.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[tuple[str, ...], int] = {}
+        self._parts: list[tuple[str, ...]] = []
+        self._rows: list[list[dict]] = []
+
+    def table_id(self, table_parts: tuple[str, ...]) -> int:
+        table_id = self._ids.get(table_parts)
+        if table_id is None:
+            table_id = self._ids[table_parts] = len(self._parts)
+            self._parts.append(table_parts)
+            self._rows.append([])
+        return table_id
+
+    def append(self, table_id: int, row: dict) -> None:
+        self._rows[table_id].append(row)
+
+    def add_row(self, table_parts: tuple[str, ...], row: dict) -> None:
+        self._rows[self.table_id(table_parts)].append(row)
+
+    @property
+    def tables(self) -> defaultdict[tuple[str, ...], list[dict]]:
+        """Rows of every table that received any, keyed by table parts."""
+        return defaultdict(
+            list,
+            ((parts, rows) for parts, rows in zip(self._parts, self._rows) if rows),
+        )
+
+
+def _row_getter(fields: list[str]):
+    """Return a function mapping a row dict to its values in field order.
+
+    The function raises KeyError when the row lacks one of the fields.
+    """
+    if len(fields) > 1:
+        return itemgetter(*fields)
+    return lambda row: [row[f] for f in fields]
+
+
+class _CsvTable:
+    """One output CSV file whose header grows as new columns are seen.
+
+    The header is the union of the keys of every row, which is only
+    known once the input is exhausted, so rows are spooled to a
+    temporary file and copied in behind the header on close.  Rows
+    written before a column was first seen are padded at that point.
+    """
+
+    def __init__(self, filename: str, spool_dir: str | None = None) -> None:
+        self.filename = filename
+        # Column names in first-seen order; a dict doubles as the set.
+        self.fields: dict[str, None] = {}
+        self._spool = tempfile.TemporaryFile(
+            "w+",
+            buffering=_WRITE_BUFFER_SIZE,
+            newline="",
+            encoding="utf-8",
+            dir=spool_dir,
+        )
+        self._writer = csv.writer(self._spool)
+        self._getter = _row_getter([])
+        self._rows = 0
+        self._ragged = False
+
+    def add_row(self, row: dict) -> None:
+        if not self.fields.keys() >= row.keys():
+            self.fields.update(dict.fromkeys(row))
+            self._getter = _row_getter(list(self.fields))
+            if self._rows:
+                self._ragged = True
+        try:
+            values = self._getter(row)
+        except KeyError:
+            values = [row.get(f, "") for f in self.fields]
+        self._writer.writerow(values)
+        self._rows += 1
+
+    def close(self) -> None:
+        self._spool.seek(0)
+        with open(
+            self.filename,
+            "w",
+            buffering=_WRITE_BUFFER_SIZE,
+            newline="",
+            encoding="utf-8",
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(self.fields)
+            if self._ragged:
+                width = len(self.fields)
+                for values in csv.reader(self._spool):
+                    writer.writerow(values + [""] * (width - len(values)))
+            else:
+                shutil.copyfileobj(self._spool, f)
+        self._spool.close()
+
+    def discard(self) -> None:
+        self._spool.close()
+
+
+class CsvSink:
+    """Writes each table to a CSV file named after its table parts.
+
+    Use as a context manager: the files are written when the block exits
+    normally, and nothing is written if it raises.
+    """
+
+    def __init__(self, directory: str = ".", no_prefix: bool = False) -> None:
+        self.directory = directory
+        self.no_prefix = no_prefix
+        self._ids: dict[tuple[str, ...], int] = {}
+        self._parts: list[tuple[str, ...]] = []
+        # Files are only created once a table gets its first row.
+        self._tables: list[_CsvTable | None] = []
+        # Output filename -> the table parts writing it.
+        self._owners: dict[str, tuple[str, ...]] = {}
+
+    def table_id(self, table_parts: tuple[str, ...]) -> int:
+        table_id = self._ids.get(table_parts)
+        if table_id is None:
+            table_id = self._ids[table_parts] = len(self._parts)
+            self._parts.append(table_parts)
+            self._tables.append(None)
+        return table_id
+
+    def append(self, table_id: int, row: dict) -> None:
+        table = self._tables[table_id]
+        if table is None:
+            table = self._tables[table_id] = self._open(self._parts[table_id])
+        table.add_row(row)
+
+    def _open(self, table_parts: tuple[str, ...]) -> _CsvTable:
+        filename = self._filename(table_parts)
+        # Tables are written concurrently on close, so two tables sharing
+        # a file would interleave their rows in it.
+        owner = self._owners.setdefault(filename, table_parts)
+        if owner != table_parts:
+            raise SinkError(
+                f"Tables {'.'.join(owner)!r} and {'.'.join(table_parts)!r} "
+                f"would both be written to {filename}"
+            )
+        # Spools can be as large as the outputs, so they sit next to them
+        # rather than in the system temp directory, which may be in RAM.
+        return _CsvTable(filename, spool_dir=self.directory)
+
+    def add_row(self, table_parts: tuple[str, ...], row: dict) -> None:
+        self.append(self.table_id(table_parts), row)
+
+    def _filename(self, table_parts: tuple[str, ...]) -> str:
+        prefix = table_parts[-1] if self.no_prefix else ".".join(table_parts)
+        return os.path.join(self.directory, f"{prefix}.csv")
+
+    def close(self) -> None:
+        tables = [table for table in self._tables if table is not None]
+        if len(tables) < 2:
+            for table in tables:
+                table.close()
+            return
+        # Copying a spool into its output file is mostly I/O, which
+        # releases the GIL, so the tables are written side by side.
+        with ThreadPoolExecutor(max_workers=min(32, len(tables))) as executor:
+            futures = [executor.submit(table.close) for table in tables]
+        for future in futures:
+            future.result()
+
+    def discard(self) -> None:
+        for table in self._tables:
+            if table is not None:
+                table.discard()
+
+    def __enter__(self) -> CsvSink:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
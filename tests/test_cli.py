@@ -4,10 +4,13 @@ Each test invokes the CLI with the same flags as the Perl tests,
 then compares byte-for-byte against the expected CSV outputs.
 """
 
+import json
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
+from json_to_multicsv import converter
 from json_to_multicsv.cli import main
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
@@ -25,9 +28,10 @@ def _load_expected_csvs(name):
     }
 
 
-def _run_test(name, cli_args, tmp_path):
+def _run_test(name, cli_args, tmp_path, input_path=None):
     """Run a test case: invoke CLI, compare outputs."""
-    input_path = FIXTURES_DIR / name / "input.json"
+    if input_path is None:
+        input_path = FIXTURES_DIR / name / "input.json"
     expected_csvs = _load_expected_csvs(name)
 
     runner = CliRunner()
@@ -134,6 +138,67 @@ def test_toplevel_list(tmp_path):
     )
 
 
+def test_toplevel_list_stream(tmp_path):
+    """--stream writes the same files when keys are already in order."""
+    pytest.importorskip("ijson")
+    # The stream visits keys in document order, so sort them up front.
+    data = json.loads((FIXTURES_DIR / "toplevel-list" / "input.json").read_text())
+    input_path = tmp_path / "sorted.json"
+    input_path.write_text(json.dumps(data, sort_keys=True))
+    _run_test(
+        "toplevel-list",
+        [
+            "--stream",
+            "--path",
+            "/:table:greetings",
+        ],
+        tmp_path,
+        input_path,
+    )
+
+
+def test_toplevel_list_jobs(tmp_path):
+    """--jobs splits the top-level table array across worker processes."""
+    _run_test(
+        "toplevel-list",
+        [
+            "--jobs",
+            "2",
+            "--path",
+            "/:table:greetings",
+        ],
+        tmp_path,
+    )
+
+
+def test_jobs_must_be_positive(tmp_path):
+    """--jobs 0 is rejected before any input is read."""
+    input_path = FIXTURES_DIR / "toplevel-list" / "input.json"
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        result = runner.invoke(
+            main,
+            ["--file", str(input_path), "--jobs", "0", "--path", "/:table:greetings"],
+        )
+        assert not list(Path(td).glob("*.csv"))
+    assert result.exit_code == 2
+    assert "Invalid value for '--jobs'" in result.output
+
+
+def test_stream_without_ijson(tmp_path, monkeypatch):
+    """--stream is a usage error when ijson is not installed."""
+    monkeypatch.setattr(converter, "ijson", None)
+    input_path = FIXTURES_DIR / "toplevel-list" / "input.json"
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path):
+        result = runner.invoke(
+            main,
+            ["--file", str(input_path), "--stream", "--path", "/:table:greetings"],
+        )
+    assert result.exit_code == 2
+    assert "--stream: streaming requires ijson" in result.output
+
+
 def test_key_name(tmp_path):
     """Custom key column names via path spec, with propagation to child tables."""
     _run_test(
@@ -213,3 +278,22 @@ def test_no_prefix_duplicate_error(tmp_path):
         assert result.exit_code != 0
         assert "duplicate table name" in result.output
         assert "--path '/*/y/*/z:table:item_2'" in result.output
+
+
+def test_no_prefix_same_leaf_under_different_parents(tmp_path):
+    """One table handler matching under two parents maps both to one file."""
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        td = Path(td)
+        # /*/*/*/x matches under table p, giving ('t', 'p', 's'), and
+        # under column q, giving ('t', 's').
+        (td / "input.json").write_text(
+            '{"a": {"p": {"b": {"x": [1]}}, "q": {"c": {"x": [2]}}}}'
+        )
+        args = ["--file", str(td / "input.json"), "--no-prefix"]
+        for spec in ["/:table:t", "/*/p:table:p", "/*/q:column", "/*/*/*/x:table:s"]:
+            args += ["--path", spec]
+        result = runner.invoke(main, args)
+        assert result.exit_code != 0
+        assert "would both be written to" in result.output
+        assert not (td / "s.csv").exists()
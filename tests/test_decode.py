@@ -0,0 +1,49 @@
+"""Tests for decoding the JSON input."""
+
+import io
+import json
+import math
+
+import pytest
+
+from json_to_multicsv import converter
+from json_to_multicsv.converter import Converter, json_to_multicsv
+from json_to_multicsv.parser import build_handlers
+
+
+def _convert(text, path_specs, table_name=None):
+    """Run the converter on a raw JSON string and return the tables dict."""
+    handlers = build_handlers(path_specs)
+    return json_to_multicsv(io.StringIO(text), handlers, table_name)
+
+
+def test_object_members_visited_in_sorted_order():
+    """Rows and columns follow sorted key order, not document order."""
+    text = json.dumps({"b": {"z": 1, "y": 2}, "a": {"x": 3}})
+    tables = _convert(text, ["/:table:item"])
+    rows = tables[("item",)]
+    assert [row["item._key"] for row in rows] == ["a", "b"]
+    assert list(rows[1]) == ["item._key", "y", "z"]
+
+
+def test_nonstandard_numbers_still_accepted():
+    """Inputs outside orjson's subset (NaN, huge ints) still decode."""
+    text = '[{"big": 123456789012345678901234567890, "nan": NaN}]'
+    tables = _convert(text, ["/:table:item"])
+    row = tables[("item",)][0]
+    assert row["big"] == 123456789012345678901234567890
+    assert math.isnan(row["nan"])
+
+
+def test_converter_convert_returns_tables():
+    """Converter.convert still returns the tables with the default sink."""
+    handlers = build_handlers(["/:table:item"])
+    tables = Converter(handlers).convert(io.StringIO('{"a": {"x": 1}}'))
+    assert tables == {("item",): [{"item._key": "a", "x": 1}]}
+
+
+def test_stream_without_ijson_names_the_extra(monkeypatch):
+    monkeypatch.setattr(converter, "ijson", None)
+    handlers = build_handlers(["/:table:item"])
+    with pytest.raises(ImportError, match=r"json-to-multicsv\[stream\]"):
+        json_to_multicsv(io.StringIO("[]"), handlers, stream=True)
@@ -0,0 +1,55 @@
+"""Handler lookup must agree with a linear scan over the handler list."""
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from json_to_multicsv.converter import Converter
+from json_to_multicsv.parser import build_handlers
+
+component = st.sampled_from(["a", "b", "0", "*"])
+path_component = st.sampled_from(["a", "b", "0", "1", "*"])
+
+
+@st.composite
+def path_specs(draw):
+    components = draw(st.lists(component, max_size=3))
+    kind = draw(st.sampled_from(["table:t", "column", "row", "ignore"]))
+    return "/" + "/".join(components) + ":" + kind
+
+
+def _linear_find(handlers, path):
+    """The original lookup: first non-fallback match, else last fallback."""
+    fallback = None
+    for handler in handlers:
+        if handler.matches(path):
+            if handler.fallback:
+                fallback = handler
+            else:
+                return handler
+    return fallback
+
+
+@given(
+    spec=path_specs(),
+    path=st.lists(path_component, max_size=4).map(tuple),
+)
+def test_matches_agrees_with_componentwise_check(spec, path):
+    for handler in build_handlers([spec]):
+        expected = len(path) == len(handler.components) and all(
+            c == "*" or c == p for c, p in zip(handler.components, path)
+        )
+        assert handler.matches(path) is expected
+
+
+@given(
+    specs=st.lists(path_specs(), max_size=6),
+    paths=st.lists(st.lists(path_component, max_size=4).map(tuple), max_size=10),
+)
+@settings(max_examples=500)
+def test_find_handler_matches_linear_scan(specs, paths):
+    handlers = build_handlers(specs)
+    converter = Converter(handlers)
+    for path in paths:
+        # Look each path up twice to exercise the memoized result too.
+        for _ in range(2):
+            assert converter._find_handler(path) is _linear_find(handlers, path)
@@ -8,7 +8,12 @@ must return a well-formed Handler.
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
-from json_to_multicsv.parser import Handler, PathSpecError, parse_path_spec
+from json_to_multicsv.parser import (
+    Handler,
+    PathSpecError,
+    _parse_with_lexer,
+    parse_path_spec,
+)
 
 # -- building blocks ----------------------------------------------------------
 
@@ -88,3 +93,17 @@ class TestFuzzParser:
             parse_path_spec(spec)
         except PathSpecError:
             pass
+
+    @given(spec=st.one_of(valid_specs(), garbage))
+    @settings(max_examples=2000)
+    def test_regex_fast_path_agrees_with_lexer(self, spec):
+        """The single-match fast path accepts exactly what the lexer does."""
+        try:
+            expected = _parse_with_lexer(spec)
+        except PathSpecError:
+            expected = None
+        try:
+            got = parse_path_spec(spec)
+        except PathSpecError:
+            got = None
+        assert got == expected
@@ -0,0 +1,34 @@
+"""Tests for converting a top-level array in worker processes."""
+
+import io
+import json
+
+from json_to_multicsv.converter import json_to_multicsv
+from json_to_multicsv.parser import build_handlers
+
+
+def _convert(data, path_specs, jobs):
+    fileobj = io.StringIO(json.dumps(data))
+    return json_to_multicsv(fileobj, build_handlers(path_specs), jobs=jobs)
+
+
+def test_parallel_matches_sequential():
+    """Rows, keys and row order are the same as a single-process walk."""
+    data = [
+        {"name": f"n{i}", "tags": ["x", "y"][: i % 3], "info": {"size": i}}
+        for i in range(50)
+    ]
+    specs = ["/:table:item", "/*/tags:table:tag", "/*/info:column"]
+    sequential = _convert(data, specs, jobs=1)
+    parallel = _convert(data, specs, jobs=3)
+    assert parallel == sequential
+    assert [row["item._key"] for row in parallel[("item",)]] == [
+        str(i) for i in range(50)
+    ]
+
+
+def test_non_table_root_is_walked_sequentially():
+    data = {"a": {"v": 1}, "b": {"v": 2}}
+    assert _convert(data, ["/:table:item"], jobs=2) == _convert(
+        data, ["/:table:item"], jobs=1
+    )
@@ -6,96 +6,69 @@ from json_to_multicsv.parser import PathSpecError, build_handlers
 
 
 def _parse(spec: str):
-    """Parse a single spec and return the primary (non-fallback) handler."""
-    handlers = build_handlers([spec])
-    return [h for h in handlers if not h.fallback][0]
-
-
-class TestValidSpecs:
-    def test_root_table(self):
-        h = _parse("/:table:item")
-        assert h.kind == "table"
-        assert h.components == []
-        assert h.name == "item"
-
-    def test_wildcard_column(self):
-        h = _parse("/*/rating:column")
-        assert h.kind == "column"
-        assert h.components == ["*", "rating"]
-        assert h.name is None
-
-    def test_nested_table(self):
-        h = _parse("/games:table:game")
-        assert h.kind == "table"
-        assert h.components == ["games"]
-        assert h.name == "game"
-
-    def test_deep_path_column(self):
-        h = _parse("/games/*/players:column")
-        assert h.kind == "column"
-        assert h.components == ["games", "*", "players"]
-
-    def test_root_row(self):
-        h = _parse("/:row")
-        assert h.kind == "row"
-        assert h.components == []
-
-    def test_ignore_handler(self):
-        h = _parse("/secret:ignore")
-        assert h.kind == "ignore"
-        assert h.components == ["secret"]
-        assert h.name is None
-
-    def test_table_with_key_name(self):
-        h = _parse("/:table:form:rptId")
-        assert h.kind == "table"
-        assert h.name == "form"
-        assert h.key_name == "rptId"
-
-    def test_table_without_key_name(self):
-        h = _parse("/:table:form")
-        assert h.kind == "table"
-        assert h.name == "form"
-        assert h.key_name is None
-
-
-class TestInvalidSpecs:
-    def test_missing_leading_slash(self):
-        with pytest.raises(PathSpecError, match=r"Expected '/'"):
-            build_handlers(["games:table:game"])
-
-    def test_trailing_slash(self):
-        with pytest.raises(PathSpecError, match=r"Expected text"):
-            build_handlers(["/games/:table:game"])
-
-    def test_unknown_handler_kind(self):
-        with pytest.raises(PathSpecError, match="Unknown handler kind"):
-            build_handlers(["/:bogus"])
-
-    def test_table_without_name(self):
-        with pytest.raises(PathSpecError, match=r"Expected ':'"):
-            build_handlers(["/:table"])
-
-    def test_column_with_name(self):
-        with pytest.raises(PathSpecError, match="does not take extra arguments"):
-            build_handlers(["/foo:column:bar"])
-
-    def test_empty_segment_double_slash(self):
-        with pytest.raises(PathSpecError, match=r"Expected text"):
-            build_handlers(["//foo:column"])
-
-    def test_missing_handler(self):
-        with pytest.raises(PathSpecError, match=r"Expected ':'"):
-            build_handlers(["/foo"])
-
-    def test_too_many_parts(self):
-        with pytest.raises(PathSpecError, match="Unexpected content"):
-            build_handlers(["/:table:name:key:extra"])
-
-    def test_empty_key_name(self):
-        with pytest.raises(PathSpecError, match=r"Expected text"):
-            build_handlers(["/:table:name:"])
-
-    def test_bare_root_no_handler(self):
-        with pytest.raises(PathSpecError, match=r"Expected ':'"):
-            build_handlers(["/"])
+    """Parse a single spec and return the primary (non-fallback) handler.
+
+    build_handlers emits each spec's handler followed by its fallback
+    column handler; the unpacking and assert fail loudly if that changes.
+    """
+    handler, fallback = build_handlers([spec])
+    assert fallback.fallback
+    return handler
+
+
+# (id, spec, kind, components, name, key_name)
+VALID = [
+    ("root_table", "/:table:item", "table", (), "item", None),
+    ("wildcard_column", "/*/rating:column", "column", ("*", "rating"), None, None),
+    ("nested_table", "/games:table:game", "table", ("games",), "game", None),
+    (
+        "deep_path_column",
+        "/games/*/players:column",
+        "column",
+        ("games", "*", "players"),
+        None,
+        None,
+    ),
+    ("root_row", "/:row", "row", (), None, None),
+    ("ignore_handler", "/secret:ignore", "ignore", ("secret",), None, None),
+    ("table_with_key_name", "/:table:form:rptId", "table", (), "form", "rptId"),
+    ("table_without_key_name", "/:table:form", "table", (), "form", None),
+]
+
+
+@pytest.mark.parametrize(
+    ("spec", "kind", "components", "name", "key_name"),
+    [case[1:] for case in VALID],
+    ids=[case[0] for case in VALID],
+)
+def test_valid_spec(spec, kind, components, name, key_name):
+    h = _parse(spec)
+    assert h.kind == kind
+    assert h.components == components
+    assert h.name == name
+    assert h.key_name == key_name
+
+
+# (id, spec, error pattern)
+INVALID = [
+    ("missing_leading_slash", "games:table:game", r"Expected '/'"),
+    ("trailing_slash", "/games/:table:game", r"Expected text"),
+    ("unknown_handler_kind", "/:bogus", "Unknown handler kind"),
+    ("table_without_name", "/:table", r"Expected ':'"),
+    ("column_with_name", "/foo:column:bar", "does not take extra arguments"),
+    ("empty_segment_double_slash", "//foo:column", r"Expected text"),
+    ("missing_handler", "/foo", r"Expected ':'"),
+    ("too_many_parts", "/:table:name:key:extra", "Unexpected content"),
+    ("empty_key_name", "/:table:name:", r"Expected text"),
+    ("bare_root_no_handler", "/", r"Expected ':'"),
+]
+
+
+@pytest.mark.parametrize(
+    ("spec", "pattern"),
+    [case[1:] for case in INVALID],
+    ids=[case[0] for case in INVALID],
+)
+def test_invalid_spec(spec, pattern):
+    with pytest.raises(PathSpecError, match=pattern):
+        build_handlers([spec])
@@ -0,0 +1,47 @@
+"""Rows keep the order in which they were opened, as in a recursive walk."""
+
+import io
+import json
+
+import pytest
+
+from json_to_multicsv.converter import json_to_multicsv
+from json_to_multicsv.parser import build_handlers
+
+DATA = {"a": {"x": 1, "meta": {"m": 2}}, "b": {"x": 3}}
+PATHS = ["/:table:item", "/*/meta:row"]
+
+
+def _convert(data, path_specs, stream=False):
+    fileobj = io.BytesIO(json.dumps(data).encode("utf-8"))
+    return json_to_multicsv(fileobj, build_handlers(path_specs), stream=stream)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_nested_row_follows_its_parent_row(stream):
+    if stream:
+        pytest.importorskip("ijson")
+    rows = _convert(DATA, PATHS, stream=stream)[("item",)]
+    assert rows == [
+        {"item._key": "a", "x": 1},
+        {"item._key": "a", "m": 2},
+        {"item._key": "b", "x": 3},
+    ]
+    # The CSV header is the union of keys in row order.
+    assert list(dict.fromkeys(k for row in rows for k in row)) == [
+        "item._key",
+        "x",
+        "m",
+    ]
+
+
+def test_deeply_nested_rows_in_preorder():
+    data = [{"r": {"v": 1, "r2": {"w": 2}}, "s": {"u": 3}}]
+    paths = ["/:table:t", "/*/r:row", "/*/r/r2:row", "/*/s:row"]
+    rows = _convert(data, paths)[("t",)]
+    assert [list(row) for row in rows] == [
+        ["t._key"],
+        ["t._key", "v"],
+        ["t._key", "w"],
+        ["t._key", "u"],
+    ]
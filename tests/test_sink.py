@@ -0,0 +1,104 @@
+"""Tests for the CSV sink that writes tables incrementally."""
+
+import csv
+import io
+import tempfile
+
+import pytest
+
+from json_to_multicsv.sink import CsvSink, SinkError
+
+
+def _dictwriter_bytes(rows):
+    """Reference output: a DictWriter over the union of all row keys."""
+    fields = list(dict.fromkeys(k for row in rows for k in row))
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=fields, restval="")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue().encode()
+
+
+def test_columns_discovered_late_are_padded(tmp_path):
+    """Rows written before a column appeared get empty cells for it."""
+    rows = [
+        {"t._key": "0", "a": 1},
+        {"t._key": "1", "b": "x,y"},
+        {"t._key": "2", "a": None, "c": "line\nbreak"},
+    ]
+    with CsvSink(directory=str(tmp_path)) as sink:
+        for row in rows:
+            sink.add_row(("t",), row)
+    assert (tmp_path / "t.csv").read_bytes() == _dictwriter_bytes(rows)
+
+
+def test_uniform_rows(tmp_path):
+    rows = [{"t._key": str(i), "v": i * 1.5} for i in range(3)]
+    with CsvSink(directory=str(tmp_path)) as sink:
+        for row in rows:
+            sink.add_row(("t",), row)
+    assert (tmp_path / "t.csv").read_bytes() == _dictwriter_bytes(rows)
+
+
+def test_no_prefix_filenames(tmp_path):
+    with CsvSink(directory=str(tmp_path), no_prefix=True) as sink:
+        sink.add_row(("item", "sales"), {"k": 1})
+    assert [p.name for p in tmp_path.iterdir()] == ["sales.csv"]
+
+
+def test_nothing_written_on_error(tmp_path):
+    def convert(sink):
+        sink.add_row(("t",), {"k": 1})
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        with CsvSink(directory=str(tmp_path)) as sink:
+            convert(sink)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_many_tables_all_written(tmp_path):
+    """Tables are written concurrently; each file gets only its own rows."""
+    names = [f"t{i}" for i in range(5)]
+    with CsvSink(directory=str(tmp_path)) as sink:
+        for name in names:
+            sink.add_row((name,), {"k": name})
+    for name in names:
+        assert (tmp_path / f"{name}.csv").read_bytes() == _dictwriter_bytes(
+            [{"k": name}]
+        )
+
+
+def test_registered_table_without_rows_writes_nothing(tmp_path):
+    with CsvSink(directory=str(tmp_path)) as sink:
+        sink.table_id(("empty",))
+        sink.append(sink.table_id(("t",)), {"k": 1})
+    assert [p.name for p in tmp_path.iterdir()] == ["t.csv"]
+
+
+def test_tables_sharing_a_filename_are_refused(tmp_path):
+    """With no_prefix, different table parts can map to the same file."""
+
+    def convert(sink):
+        sink.add_row(("t", "s"), {"k": 1})
+        sink.add_row(("t", "p", "s"), {"k": 2})
+
+    with pytest.raises(SinkError, match=r"'t\.s' and 't\.p\.s'.*s\.csv"):
+        with CsvSink(directory=str(tmp_path), no_prefix=True) as sink:
+            convert(sink)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spools_live_in_the_output_directory(tmp_path, monkeypatch):
+    """Spools can be as large as the outputs, so they avoid the system tmp."""
+    dirs = []
+    real = tempfile.TemporaryFile
+
+    def spy(*args, **kwargs):
+        dirs.append(kwargs.get("dir"))
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(tempfile, "TemporaryFile", spy)
+    with CsvSink(directory=str(tmp_path)) as sink:
+        sink.add_row(("t",), {"k": 1})
+    assert dirs == [str(tmp_path)]
@@ -0,0 +1,122 @@
+"""Tests for the ijson-based StreamingConverter."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from json_to_multicsv.converter import ConvertError, json_to_multicsv
+from json_to_multicsv.parser import build_handlers
+
+pytest.importorskip("ijson")
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+FIXTURE_PATHS = {
+    "basic": (
+        [
+            "/:table:item",
+            "/*/rating:column",
+            "/*/sales:table:sales",
+            "/*/appendix:table:appendix",
+            "/*/genres:table:genres",
+        ],
+        None,
+    ),
+    "binary": (["/:table:main"], None),
+    "column-list": (
+        [
+            "/:table:shapes",
+            "/*/points:column",
+            "/*/points/0:column",
+            "/*/points/1:column",
+        ],
+        None,
+    ),
+    "tmtour": (
+        [
+            "/:row",
+            "/games:table:game",
+            "/games/*/players:column",
+            "/options:table:option",
+        ],
+        "main",
+    ),
+    "toplevel-list": (["/:table:greetings"], None),
+    "key-name": (["/:table:item:itemId", "/*/subs:table:sub:subId"], None),
+}
+
+
+def _convert(data, path_specs, table_name=None, stream=True):
+    fileobj = io.BytesIO(json.dumps(data).encode("utf-8"))
+    handlers = build_handlers(path_specs)
+    return json_to_multicsv(fileobj, handlers, table_name, stream=stream)
+
+
+def _normalize(tables):
+    """Tables as comparable sets of rows, ignoring row and column order."""
+    return {
+        parts: sorted(repr(sorted(row.items())) for row in rows)
+        for parts, rows in tables.items()
+    }
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURE_PATHS))
+def test_matches_tree_converter(name):
+    """Streaming produces the same rows as the tree walk, up to order."""
+    path_specs, table_name = FIXTURE_PATHS[name]
+    input_path = FIXTURES_DIR / name / "input.json"
+    results = []
+    for stream in (False, True):
+        with input_path.open("rb") as f:
+            handlers = build_handlers(path_specs)
+            results.append(json_to_multicsv(f, handlers, table_name, stream=stream))
+    tree, streamed = results
+    assert _normalize(streamed) == _normalize(tree)
+
+
+def test_numbers_match_tree_converter():
+    """Wide integers stay int and other numbers decode as json.loads does."""
+    raw = (
+        b'{"big": [10000000000000000000, 1E400, 1.0, 0.1],'
+        b' "obj": {"a": {"n": 10000000000000000000, "f": 1E400, "g": 0.1}}}'
+    )
+    path_specs = ["/:row", "/big:table:big", "/obj:table:obj"]
+    results = []
+    for stream in (False, True):
+        handlers = build_handlers(path_specs)
+        results.append(
+            json_to_multicsv(io.BytesIO(raw), handlers, "main", stream=stream)
+        )
+    tree, streamed = results
+    assert _normalize(streamed) == _normalize(tree)
+    assert streamed[("main", "obj")] == [
+        {"main._key": "a", "n": 10000000000000000000, "f": float("inf"), "g": 0.1}
+    ]
+
+
+def test_document_order():
+    """Object members are visited in document order, not sorted."""
+    data = {"b": {"z": 1, "y": 2}, "a": {"x": 3}}
+    rows = _convert(data, ["/:table:item"])[("item",)]
+    assert [row["item._key"] for row in rows] == ["b", "a"]
+    assert list(rows[0]) == ["item._key", "z", "y"]
+
+
+def test_ignored_subtree_is_skipped():
+    data = [{"keep": 1, "drop": {"deep": [{"x": [1, 2]}]}}]
+    rows = _convert(data, ["/:table:item", "/*/drop:ignore"])[("item",)]
+    assert rows == [{"item._key": "0", "keep": 1}]
+
+
+def test_no_handler_error():
+    data = [{"nested": {"a": 1}}]
+    with pytest.raises(ConvertError, match=r"--path '/\*/nested"):
+        _convert(data, ["/:table:item"])
+
+
+def test_column_collision_error():
+    data = {"x": {"a.b": 1, "a": {"b": 2}}}
+    with pytest.raises(ConvertError, match="Column name.*already exists"):
+        _convert(data, ["/:table:item", "/*/a:column"])